@@ -1,4 +1,14 @@
 """Brand Centre connectors."""
-from .api_client import BrandCenterClient, BrandGuidelines, BrandCenterError
+from .api_client import (
+    BrandCenterClient,
+    BrandCenterError,
+    BrandGuidelines,
+    CachedBrandCenterClient,
+)
 
-__all__ = ["BrandCenterClient", "BrandGuidelines", "BrandCenterError"]
+__all__ = [
+    "BrandCenterClient",
+    "BrandGuidelines",
+    "BrandCenterError",
+    "CachedBrandCenterClient",
+]
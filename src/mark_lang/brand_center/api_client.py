@@ -1,21 +1,66 @@
 """Brand Centre connectivity adhering to DNB security requirements."""
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from types import SimpleNamespace
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Dict, Iterable, Optional, Protocol
 
 try:  # pragma: no cover - optional dependency
     import requests  # type: ignore
 except Exception:  # pragma: no cover - fallback to stdlib
     requests = None
 
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - fallback to stdlib
+    orjson = None
+
 import urllib.request
 
 
+def _loads(payload: str | bytes) -> Any:
+    """Decode JSON with orjson when available, stdlib otherwise."""
+
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+_DEFAULT_SESSION = None
+
+
+def _default_session():  # pragma: no cover - environment-dependent
+    """Return a process-wide pooled session shared by all clients.
+
+    Sharing one session keeps TCP/TLS connections alive between
+    requests instead of paying a fresh handshake per client instance.
+    """
+
+    global _DEFAULT_SESSION
+    if _DEFAULT_SESSION is None:
+        from requests.adapters import HTTPAdapter, Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _DEFAULT_SESSION = session
+    return _DEFAULT_SESSION
+
+
 class SupportsRequest(Protocol):  # pragma: no cover - structural typing helper
-    def request(self, method: str, url: str, headers: Dict[str, str], timeout: int) -> Any: ...
+    def request(
+        self, method: str, url: str, headers: Dict[str, str], timeout: float | tuple[float, float]
+    ) -> Any: ...
 
 
 class BrandCenterError(RuntimeError):
@@ -41,7 +86,10 @@ class BrandGuidelines:
 class _UrlLibSession:
     """Minimal HTTP session using the standard library."""
 
-    def request(self, method: str, url: str, headers: Dict[str, str], timeout: int):
+    def request(self, method: str, url: str, headers: Dict[str, str], timeout: float | tuple[float, float]):
+        if isinstance(timeout, tuple):
+            # urlopen only takes one overall budget; spend the combined allowance
+            timeout = sum(timeout)
         request = urllib.request.Request(url, method=method, headers=headers)
         with urllib.request.urlopen(request, timeout=timeout) as response:  # nosec B310
             payload = response.read()
@@ -49,7 +97,7 @@ class _UrlLibSession:
             return SimpleNamespace(
                 status_code=response.status,
                 text=text,
-                json=lambda: json.loads(text or "{}"),
+                json=lambda: _loads(text or "{}"),
             )
 
 
@@ -62,35 +110,79 @@ class BrandCenterClient:
         base_url: str,
         api_key: str,
         session: Optional[SupportsRequest] = None,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 10.0,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._guideline_cache: Dict[str, tuple[str, BrandGuidelines]] = {}
         if session is not None:
             self.session = session
         elif requests is not None:  # pragma: no cover - environment-dependent
-            self.session = requests.Session()
+            self.session = _default_session()
         else:
             self.session = _UrlLibSession()
 
     def fetch_guidelines(self, brand_id: str) -> BrandGuidelines:
         """Retrieve brand guidelines, ensuring sensitive data is safeguarded."""
 
-        response = self._request("GET", f"/brands/{brand_id}/guidelines")
+        cached = self._guideline_cache.get(brand_id)
+        conditional_headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._request(
+            "GET", f"/brands/{brand_id}/guidelines", extra_headers=conditional_headers
+        )
+        if cached is not None and getattr(response, "status_code", None) == 304:
+            return cached[1]
         payload = response.json()
-        return BrandGuidelines(
+        guidelines = BrandGuidelines(
             tone_of_voice=payload.get("tone_of_voice", ""),
             visual_style=payload.get("visual_style", ""),
             compliance_notes=payload.get("compliance_notes", ""),
         )
+        etag = getattr(response, "headers", {}).get("ETag", "") or ""
+        if etag:
+            self._guideline_cache[brand_id] = (etag, guidelines)
+        return guidelines
+
+    async def afetch_guidelines(self, brand_id: str) -> BrandGuidelines:
+        """Fetch guidelines without blocking the caller's event loop.
+
+        The transport is the blocking pooled session, so the call runs on
+        a worker thread; ETag caching and error handling are shared with
+        :meth:`fetch_guidelines`.
+        """
+
+        return await asyncio.to_thread(self.fetch_guidelines, brand_id)
+
+    def fetch_guidelines_many(self, brand_ids: Iterable[str]) -> Dict[str, BrandGuidelines]:
+        """Fetch guidelines for several brands with overlapped round-trips.
+
+        Requests run on a thread pool over the shared pooled session, so
+        network latency overlaps instead of accumulating per brand.
+        Duplicate ids are fetched once.
+        """
+
+        unique_ids = list(dict.fromkeys(brand_ids))
+        if not unique_ids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(unique_ids))) as executor:
+            results = executor.map(self.fetch_guidelines, unique_ids)
+        return dict(zip(unique_ids, results))
 
-    def _request(self, method: str, path: str):
+    def _request(self, method: str, path: str, *, extra_headers: Optional[Dict[str, str]] = None):
         url = f"{self.base_url}{path}"
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
-        response = self.session.request(method, url, headers=headers, timeout=10)
+        if extra_headers:
+            headers.update(extra_headers)
+        response = self.session.request(
+            method, url, headers=headers, timeout=(self.connect_timeout, self.read_timeout)
+        )
         self._validate_response(response)
         return response
 
@@ -109,3 +201,34 @@ class BrandCenterClient:
             return response.json().get("detail", response.text)
         except Exception:  # pragma: no cover - safe fallback
             return getattr(response, "text", "")
+
+
+class CachedBrandCenterClient(BrandCenterClient):
+    """Client that serves repeat guideline lookups from a TTL cache.
+
+    Guidelines change infrequently, so repeat fetches for the same brand
+    within the TTL become an O(1) dict lookup instead of a round-trip
+    (even a 304 revalidation still pays network latency).
+    """
+
+    def __init__(self, *, ttl: float = 3600.0, maxsize: int = 512, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._ttl_cache: Dict[str, tuple[float, BrandGuidelines]] = {}
+        self._ttl_lock = threading.Lock()
+
+    def fetch_guidelines(self, brand_id: str) -> BrandGuidelines:
+        now = time.monotonic()
+        with self._ttl_lock:
+            entry = self._ttl_cache.get(brand_id)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        guidelines = super().fetch_guidelines(brand_id)
+
+        with self._ttl_lock:
+            if len(self._ttl_cache) >= self._maxsize:
+                self._ttl_cache.pop(next(iter(self._ttl_cache)))
+            self._ttl_cache[brand_id] = (now + self._ttl, guidelines)
+        return guidelines
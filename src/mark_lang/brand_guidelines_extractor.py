@@ -3,24 +3,95 @@ from __future__ import annotations
 
 import json
 import re
-from typing import Any, Dict, List
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List
 
-from pydantic import BaseModel, Field
+try:  # pragma: no cover - optional dependency
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - fallback to stdlib
+    orjson = None
 
+# Compiled once at import time so repeated extraction runs reuse the same
+# pattern objects instead of re-parsing them on every call.
+_TONE_DESCRIPTORS_RE = re.compile(
+    r'\b(professional|trustworthy|friendly|warm|innovative|reliable|personal|empowering|'
+    r'authentic|transparent|expert|approachable|confident|caring|dynamic|modern)\b',
+    re.IGNORECASE,
+)
+_COLOR_RE = re.compile(
+    r'\b(blue|green|red|orange|yellow|white|black|gray|grey|purple|modern|clean|minimal|bold|elegant)\b',
+    re.IGNORECASE,
+)
+_BULLET_RE = re.compile(r'[•\-\*]\s+([A-Z][^•\-\*\n]{20,150})')
+_AUDIENCE_RE = re.compile(
+    r'(?:target|audience|segment|customer)[:\s]+([A-Za-z\s,\-]+?)(?:\.|;|\n)',
+    re.IGNORECASE,
+)
+_COMMON_AUDIENCES_RE = re.compile(
+    r'\b(investors|customers|retailers|SMB|small business|finance leaders|'
+    r'operations leaders|consumers|households|women|men|youth|seniors)\b',
+    re.IGNORECASE,
+)
+_CAMPAIGN_RE = re.compile(r'(?:campaign|theme|initiative)[:\s]+([A-Z][^\.;\n]{10,80})')
+_VALUE_RE = re.compile(
+    r'\b(trust|innovation|integrity|excellence|sustainability|responsibility|'
+    r'transparency|empowerment|collaboration|customer-centric|quality|reliability)\b'
+)
+_THEMATIC_RE = re.compile(
+    r'\b(growth|investment|savings|digital|sustainability|'
+    r'empowerment|trust|partnership|innovation|community)\b'
+)
+_CHANNEL_NAMES = ("email", "social", "web", "digital", "print", "video", "tv", "radio")
+_CHANNEL_RE = re.compile(
+    r'(' + '|'.join(_CHANNEL_NAMES) + r')[:\s]+([^\.;\n]{20,150})',
+    re.IGNORECASE,
+)
 
-class BrandGuidelinesExtracted(BaseModel):
+# Shared, immutable keyword buckets: one frozenset per category plus a
+# compiled alternation so line classification is a single C-level scan
+# instead of a Python-level any() over substrings.
+KEYWORD_BUCKETS: Dict[str, frozenset[str]] = {
+    "tone": frozenset(("tone", "voice", "style", "personality", "character", "communication")),
+    "visual": frozenset(("visual", "design", "color", "font", "typography", "aesthetic", "look", "feel")),
+    "audience": frozenset(("audience", "target", "segment", "customer", "demographic")),
+    "values": frozenset(("value", "principle", "belief", "mission", "vision", "purpose")),
+    "compliance": frozenset(("compliance", "legal", "regulation", "policy", "requirement", "gdpr", "privacy")),
+    "messaging": frozenset(("message", "messaging", "narrative", "story", "positioning")),
+    "campaign": frozenset(("campaign", "initiative", "activation", "program")),
+    "content": frozenset(("content", "creative", "copy", "asset", "material")),
+}
+_KEYWORD_RES: Dict[str, re.Pattern[str]] = {
+    category: re.compile("|".join(map(re.escape, sorted(words))))
+    for category, words in KEYWORD_BUCKETS.items()
+}
+
+
+def _take_unique(items: Iterable[str], limit: int) -> List[str]:
+    """Collect up to ``limit`` unique items, preserving first-seen order."""
+
+    unique: Dict[str, None] = {}
+    for item in items:
+        unique.setdefault(item, None)
+        if len(unique) >= limit:
+            break
+    return list(unique)
+
+
+@dataclass(slots=True)
+class BrandGuidelinesExtracted:
     """Structured brand guidelines extracted from documents."""
-    
-    brand_name: str = Field(default="DNB", description="Brand name")
-    tone_of_voice: str = Field(default="", description="Brand tone of voice and communication style")
-    visual_style: str = Field(default="", description="Visual design style and aesthetics")
-    messaging_principles: List[str] = Field(default_factory=list, description="Key messaging principles")
-    target_audiences: List[str] = Field(default_factory=list, description="Target audience segments")
-    brand_values: List[str] = Field(default_factory=list, description="Core brand values")
-    compliance_notes: str = Field(default="", description="Compliance and legal requirements")
-    campaign_themes: List[str] = Field(default_factory=list, description="Recurring campaign themes")
-    content_guidelines: List[str] = Field(default_factory=list, description="Content creation guidelines")
-    channel_specific: Dict[str, str] = Field(default_factory=dict, description="Channel-specific guidelines")
+
+    brand_name: str = "DNB"
+    tone_of_voice: str = ""
+    visual_style: str = ""
+    messaging_principles: List[str] = field(default_factory=list)
+    target_audiences: List[str] = field(default_factory=list)
+    brand_values: List[str] = field(default_factory=list)
+    compliance_notes: str = ""
+    campaign_themes: List[str] = field(default_factory=list)
+    content_guidelines: List[str] = field(default_factory=list)
+    channel_specific: Dict[str, str] = field(default_factory=dict)
 
 
 class BrandGuidelinesExtractor:
@@ -28,16 +99,8 @@ class BrandGuidelinesExtractor:
 
     def __init__(self):
         """Initialize the extractor."""
-        self.keywords = {
-            "tone": ["tone", "voice", "style", "personality", "character", "communication"],
-            "visual": ["visual", "design", "color", "font", "typography", "aesthetic", "look", "feel"],
-            "audience": ["audience", "target", "segment", "customer", "demographic"],
-            "values": ["value", "principle", "belief", "mission", "vision", "purpose"],
-            "compliance": ["compliance", "legal", "regulation", "policy", "requirement", "gdpr", "privacy"],
-            "messaging": ["message", "messaging", "narrative", "story", "positioning"],
-            "campaign": ["campaign", "initiative", "activation", "program"],
-            "content": ["content", "creative", "copy", "asset", "material"],
-        }
+        self.keywords = KEYWORD_BUCKETS
+        self.keyword_res = _KEYWORD_RES
     
     def extract_from_documents(self, documents: List[Dict]) -> BrandGuidelinesExtracted:
         """
@@ -51,46 +114,60 @@ class BrandGuidelinesExtractor:
         """
         guidelines = BrandGuidelinesExtracted()
         
-        # Combine all document text
-        all_text = "\n\n".join(
-            doc.get("full_text", "") for doc in documents if doc.get("full_text")
-        )
+        # Combine all document text; the walrus keeps it to one lookup per doc
+        texts = [text for doc in documents if (text := doc.get("full_text"))]
+        all_text = "\n\n".join(texts)
         
         if not all_text:
             return guidelines
-        
+
+        # Lowercase, split, and classify once; each extractor reuses the shared results
+        lower_text = all_text.lower()
+        lines = all_text.split("\n")
+        lower_lines = lower_text.split("\n")
+        hits = self._classify_lines(lower_lines)
+
         # Extract different guideline components
-        guidelines.tone_of_voice = self._extract_tone(all_text)
-        guidelines.visual_style = self._extract_visual_style(all_text)
-        guidelines.messaging_principles = self._extract_messaging_principles(all_text)
+        guidelines.tone_of_voice = self._extract_tone(all_text, lines, hits["tone"])
+        guidelines.visual_style = self._extract_visual_style(all_text, lines, hits["visual"])
+        guidelines.messaging_principles = self._extract_messaging_principles(all_text, lines, hits["messaging"])
         guidelines.target_audiences = self._extract_audiences(all_text)
-        guidelines.brand_values = self._extract_values(all_text)
-        guidelines.compliance_notes = self._extract_compliance(all_text)
-        guidelines.campaign_themes = self._extract_campaign_themes(all_text)
-        guidelines.content_guidelines = self._extract_content_guidelines(all_text)
+        guidelines.brand_values = self._extract_values(lower_text, lines, hits["values"])
+        guidelines.compliance_notes = self._extract_compliance(lines, hits["compliance"])
+        guidelines.campaign_themes = self._extract_campaign_themes(all_text, lower_text)
+        guidelines.content_guidelines = self._extract_content_guidelines(lower_text, lines, hits["content"])
         guidelines.channel_specific = self._extract_channel_guidelines(all_text)
-        
+
         return guidelines
-    
-    def _extract_tone(self, text: str) -> str:
+
+    def _classify_lines(self, lower_lines: List[str]) -> Dict[str, List[int]]:
+        """Bucket line indices per keyword category in a single pass."""
+        hits: Dict[str, List[int]] = {category: [] for category in self.keywords}
+        # Pre-bind the per-category append/search pairs so the inner loop is
+        # two plain calls per category with no attribute lookups.
+        matchers = [
+            (hits[category].append, pattern.search)
+            for category, pattern in self.keyword_res.items()
+        ]
+        for i, lower_line in enumerate(lower_lines):
+            for append, search in matchers:
+                if search(lower_line):
+                    append(i)
+        return hits
+
+    def _extract_tone(self, text: str, lines: List[str], hit_lines: List[int]) -> str:
         """Extract tone of voice guidelines."""
         tone_indicators = []
-        
+
         # Look for sections mentioning tone or voice
-        lines = text.split("\n")
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in self.keywords["tone"]):
-                # Capture the line and next few lines
-                context = " ".join(lines[i:min(i+3, len(lines))])
-                if len(context) > 20:
-                    tone_indicators.append(context)
-        
+        for i in hit_lines:
+            # Capture the line and next few lines
+            context = " ".join(lines[i:min(i+3, len(lines))])
+            if len(context) > 20:
+                tone_indicators.append(context)
+
         # Find descriptive adjectives
-        descriptors = re.findall(
-            r'\b(professional|trustworthy|friendly|warm|innovative|reliable|personal|empowering|'
-            r'authentic|transparent|expert|approachable|confident|caring|dynamic|modern)\b',
-            text.lower()
-        )
+        descriptors = [match.lower() for match in _TONE_DESCRIPTORS_RE.findall(text)]
         
         if tone_indicators:
             return "; ".join(tone_indicators[:3])
@@ -99,22 +176,17 @@ class BrandGuidelinesExtractor:
         else:
             return "Professional and trustworthy"
     
-    def _extract_visual_style(self, text: str) -> str:
+    def _extract_visual_style(self, text: str, lines: List[str], hit_lines: List[int]) -> str:
         """Extract visual style guidelines."""
         visual_indicators = []
-        
-        lines = text.split("\n")
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in self.keywords["visual"]):
-                context = " ".join(lines[i:min(i+2, len(lines))])
-                if len(context) > 20:
-                    visual_indicators.append(context)
-        
+
+        for i in hit_lines:
+            context = " ".join(lines[i:min(i+2, len(lines))])
+            if len(context) > 20:
+                visual_indicators.append(context)
+
         # Look for color mentions
-        colors = re.findall(
-            r'\b(blue|green|red|orange|yellow|white|black|gray|grey|purple|modern|clean|minimal|bold|elegant)\b',
-            text.lower()
-        )
+        colors = [match.lower() for match in _COLOR_RE.findall(text)]
         
         if visual_indicators:
             return "; ".join(visual_indicators[:2])
@@ -123,149 +195,116 @@ class BrandGuidelinesExtractor:
         else:
             return "Corporate, clean, minimal"
     
-    def _extract_messaging_principles(self, text: str) -> List[str]:
+    def _extract_messaging_principles(self, text: str, lines: List[str], hit_lines: List[int]) -> List[str]:
         """Extract key messaging principles."""
         principles = []
-        
+
         # Look for bullet points or numbered lists
-        bullet_pattern = r'[•\-\*]\s+([A-Z][^•\-\*\n]{20,150})'
-        bullets = re.findall(bullet_pattern, text)
-        
-        lines = text.split("\n")
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in self.keywords["messaging"]):
-                # Capture next few lines
-                for j in range(i+1, min(i+5, len(lines))):
-                    if lines[j].strip() and len(lines[j]) > 20:
-                        principles.append(lines[j].strip())
+        bullets = _BULLET_RE.findall(text)
+
+        for i in hit_lines:
+            # Capture next few lines
+            for j in range(i+1, min(i+5, len(lines))):
+                if lines[j].strip() and len(lines[j]) > 20:
+                    principles.append(lines[j].strip())
         
         # Add relevant bullets
         for bullet in bullets:
             if any(keyword in bullet.lower() for keyword in self.keywords["messaging"]):
                 principles.append(bullet.strip())
         
-        return list(set(principles))[:5]
+        return _take_unique(principles, 5)
     
     def _extract_audiences(self, text: str) -> List[str]:
         """Extract target audience information."""
         audiences = []
         
         # Look for audience mentions
-        audience_pattern = r'(?:target|audience|segment|customer)[:\s]+([A-Za-z\s,\-]+?)(?:\.|;|\n)'
-        matches = re.findall(audience_pattern, text, re.IGNORECASE)
+        matches = _AUDIENCE_RE.findall(text)
         
         for match in matches:
             if len(match.strip()) > 10 and len(match.strip()) < 100:
                 audiences.append(match.strip())
         
         # Common audience patterns
-        common_audiences = re.findall(
-            r'\b(investors|customers|retailers|SMB|small business|finance leaders|'
-            r'operations leaders|consumers|households|women|men|youth|seniors)\b',
-            text.lower()
-        )
-        
-        audiences.extend([aud.capitalize() for aud in set(common_audiences)])
+        common_audiences = [match.lower() for match in _COMMON_AUDIENCES_RE.findall(text)]
         
-        return list(set(audiences))[:5]
+        audiences.extend(aud.capitalize() for aud in dict.fromkeys(common_audiences))
+
+        return _take_unique(audiences, 5)
     
-    def _extract_values(self, text: str) -> List[str]:
+    def _extract_values(self, lower_text: str, lines: List[str], hit_lines: List[int]) -> List[str]:
         """Extract brand values."""
-        values = []
-        
-        # Common brand values
-        value_keywords = [
-            "trust", "innovation", "integrity", "excellence", "sustainability",
-            "responsibility", "transparency", "empowerment", "collaboration",
-            "customer-centric", "quality", "reliability"
-        ]
-        
-        for keyword in value_keywords:
-            if keyword in text.lower():
-                values.append(keyword.capitalize())
+        # Common brand values, ranked by how often they occur in the corpus
+        counts = Counter(match.group(1) for match in _VALUE_RE.finditer(lower_text))
+        values = [keyword.capitalize() for keyword, _ in counts.most_common()]
         
         # Look for explicit value statements
-        lines = text.split("\n")
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in self.keywords["values"]):
-                for j in range(i+1, min(i+4, len(lines))):
-                    if lines[j].strip() and len(lines[j]) > 15 and len(lines[j]) < 80:
-                        values.append(lines[j].strip())
+        for i in hit_lines:
+            for j in range(i+1, min(i+4, len(lines))):
+                if lines[j].strip() and len(lines[j]) > 15 and len(lines[j]) < 80:
+                    values.append(lines[j].strip())
         
-        return list(set(values))[:6]
+        return _take_unique(values, 6)
     
-    def _extract_compliance(self, text: str) -> str:
+    def _extract_compliance(self, lines: List[str], hit_lines: List[int]) -> str:
         """Extract compliance and legal requirements."""
         compliance_notes = []
-        
-        lines = text.split("\n")
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in self.keywords["compliance"]):
-                context = " ".join(lines[i:min(i+3, len(lines))])
-                if len(context) > 20:
-                    compliance_notes.append(context)
+
+        for i in hit_lines:
+            context = " ".join(lines[i:min(i+3, len(lines))])
+            if len(context) > 20:
+                compliance_notes.append(context)
         
         if compliance_notes:
             return "; ".join(compliance_notes[:2])
         else:
             return "Ensure alignment with DNB data privacy policies and Norwegian financial regulations."
     
-    def _extract_campaign_themes(self, text: str) -> List[str]:
+    def _extract_campaign_themes(self, text: str, lower_text: str) -> List[str]:
         """Extract recurring campaign themes."""
         themes = []
         
         # Look for campaign names and themes
-        campaign_pattern = r'(?:campaign|theme|initiative)[:\s]+([A-Z][^\.;\n]{10,80})'
-        matches = re.findall(campaign_pattern, text)
+        matches = _CAMPAIGN_RE.findall(text)
         
         themes.extend([match.strip() for match in matches if len(match.strip()) > 10])
+
+        # Thematic keywords, ranked by how often they occur in the corpus
+        counts = Counter(match.group(1) for match in _THEMATIC_RE.finditer(lower_text))
+        themes.extend(keyword.capitalize() for keyword, _ in counts.most_common())
         
-        # Look for thematic keywords
-        thematic_keywords = [
-            "growth", "investment", "savings", "digital", "sustainability",
-            "empowerment", "trust", "partnership", "innovation", "community"
-        ]
-        
-        for keyword in thematic_keywords:
-            if keyword in text.lower():
-                themes.append(keyword.capitalize())
-        
-        return list(set(themes))[:8]
+        return _take_unique(themes, 8)
     
-    def _extract_content_guidelines(self, text: str) -> List[str]:
+    def _extract_content_guidelines(self, lower_text: str, lines: List[str], hit_lines: List[int]) -> List[str]:
         """Extract content creation guidelines."""
         guidelines = []
-        
-        lines = text.split("\n")
-        for i, line in enumerate(lines):
-            if any(keyword in line.lower() for keyword in self.keywords["content"]):
-                # Capture context
-                for j in range(i+1, min(i+4, len(lines))):
-                    if lines[j].strip() and len(lines[j]) > 25:
-                        guidelines.append(lines[j].strip())
+
+        for i in hit_lines:
+            # Capture context
+            for j in range(i+1, min(i+4, len(lines))):
+                if lines[j].strip() and len(lines[j]) > 25:
+                    guidelines.append(lines[j].strip())
         
         # Add common content guidelines
-        if "clear" in text.lower() and "simple" in text.lower():
+        if "clear" in lower_text and "simple" in lower_text:
             guidelines.append("Use clear and simple language")
-        if "authentic" in text.lower():
+        if "authentic" in lower_text:
             guidelines.append("Maintain authentic brand voice")
-        if "visual" in text.lower() and "strong" in text.lower():
+        if "visual" in lower_text and "strong" in lower_text:
             guidelines.append("Use strong visual storytelling")
         
-        return list(set(guidelines))[:5]
+        return _take_unique(guidelines, 5)
     
     def _extract_channel_guidelines(self, text: str) -> Dict[str, str]:
         """Extract channel-specific guidelines."""
         channels = {}
-        
-        channel_names = ["email", "social", "web", "digital", "print", "video", "tv", "radio"]
-        
-        for channel in channel_names:
-            channel_pattern = rf'{channel}[:\s]+([^\.;\n]{{20,150}})'
-            matches = re.findall(channel_pattern, text.lower())
-            if matches:
-                channels[channel] = matches[0].strip().capitalize()
-        
+
+        for match in _CHANNEL_RE.finditer(text):
+            channel = match.group(1).lower()
+            if channel not in channels:
+                channels[channel] = match.group(2).strip().capitalize()
+
         return channels
     
     def to_json(self, guidelines: BrandGuidelinesExtracted, output_path: str) -> None:
@@ -290,5 +329,10 @@ class BrandGuidelinesExtractor:
             }
         }
         
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # One bytes blob, one binary write: skips the text-layer encode
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
@@ -1,11 +1,35 @@
 """Utilities for ingesting business briefs into structured representations."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, Optional
 
 
+_TITLE_SCAN_LIMIT = 4096
+
+
+def _first_nonempty_line(text: str) -> Optional[str]:
+    """Return the first non-empty line of ``text``.
+
+    Only the first few kilobytes are scanned so deriving a title from a
+    multi-megabyte brief never materializes every line.
+    """
+
+    head = text[:_TITLE_SCAN_LIMIT]
+    start = 0
+    while start < len(head):
+        end = head.find("\n", start)
+        if end == -1:
+            end = len(head)
+        line = head[start:end].strip()
+        if line:
+            return line
+        start = end + 1
+    return None
+
+
 @dataclass
 class BusinessBrief:
     """Lightweight container for a business brief."""
@@ -15,17 +39,23 @@ class BusinessBrief:
     source: Optional[str] = None
     tags: list[str] = field(default_factory=list)
 
+    def __post_init__(self) -> None:
+        # Sort once up front so to_text never re-sorts per call; tags
+        # itself keeps caller order because resolve_brand_id falls back
+        # to the first supplied tag
+        self._sorted_tags = sorted(self.tags)
+
     def to_text(self) -> str:
         """Return a canonical text representation of the brief."""
 
-        header = f"Title: {self.title}\n"
-        body = self.content.strip()
-        if self.tags:
-            tags_line = ", ".join(sorted(self.tags))
-            header += f"Tags: {tags_line}\n"
+        parts = [f"Title: {self.title}"]
+        if self._sorted_tags:
+            parts.append("Tags: " + ", ".join(self._sorted_tags))
         if self.source:
-            header += f"Source: {self.source}\n"
-        return f"{header}\n{body}".strip()
+            parts.append(f"Source: {self.source}")
+        parts.append("")
+        parts.append(self.content.strip())
+        return "\n".join(parts).strip()
 
 
 class BriefIngestor:
@@ -68,16 +98,26 @@ class BriefIngestor:
     def batch_from_paths(
         self, paths: Iterable[str | Path], *, tags: Optional[Iterable[str]] = None
     ) -> list[BusinessBrief]:
-        """Convenience helper to load multiple briefs at once."""
+        """Convenience helper to load multiple briefs at once.
+
+        File reads are fanned out over a thread pool so the batch overlaps
+        filesystem latency instead of blocking on one file at a time.
+        """
 
-        return [self.from_path(path, tags=tags) for path in paths]
+        paths = list(paths)
+        if not paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            return list(executor.map(lambda path: self.from_path(path, tags=tags), paths))
 
     def _derive_title(
         self, text: str, *, fallback: Optional[str] = None, prefer_fallback: bool = False
     ) -> str:
         """Infer a brief title using the first line of text or a fallback."""
 
-        first_line = next((line.strip() for line in text.splitlines() if line.strip()), None)
-        if first_line and not prefer_fallback:
+        if prefer_fallback:
+            return fallback or self.default_title
+        first_line = _first_nonempty_line(text)
+        if first_line:
             return first_line[:80]
         return fallback or self.default_title
@@ -1,7 +1,9 @@
 """Extraction utilities for creative briefs."""
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional
 
 from .brief_ingest import BusinessBrief
@@ -35,6 +37,18 @@ DEFAULT_VALUES = {
 }
 
 
+@lru_cache(maxsize=16)
+def _section_pattern(fields: tuple) -> re.Pattern:
+    """Compile the multi-field section alternation once per field set.
+
+    One combined pattern finds every section header in a single pass
+    over the content instead of one scan per field; the cache keeps
+    extractors with the same fields sharing one compiled pattern.
+    """
+
+    return re.compile(r"(" + "|".join(map(re.escape, fields)) + r"):", re.IGNORECASE)
+
+
 class CreativeBriefExtractor:
     """Extract structured data from a :class:`BusinessBrief`."""
 
@@ -64,22 +78,15 @@ class CreativeBriefExtractor:
         return prompts
 
     def _segment_sections(self, content: str) -> Dict[str, str]:
-        normalized = content.lower()
         sections: Dict[str, str] = {}
-        for field in DEFAULT_VALUES:
-            marker = f"{field}:"
-            start = normalized.find(marker)
-            if start == -1:
+        matches = list(_section_pattern(tuple(self.defaults)).finditer(content))
+        for index, match in enumerate(matches):
+            field = match.group(1).lower()
+            if field in sections:
                 continue
-            start_index = start + len(marker)
-            end_index = self._find_section_end(normalized, start_index)
-            sections[field] = content[start_index:end_index].strip().rstrip("\n")
+            end_index = matches[index + 1].start() if index + 1 < len(matches) else len(content)
+            sections[field] = content[match.end():end_index].strip().rstrip("\n")
         return sections
 
     def _resolve_value(self, field: str, sections: Dict[str, str]) -> str:
         return sections.get(field, self.defaults[field])
-
-    def _find_section_end(self, normalized: str, start_index: int) -> int:
-        next_indices = [normalized.find(f"{field}:", start_index) for field in DEFAULT_VALUES]
-        candidates = [idx for idx in next_indices if idx != -1]
-        return min(candidates) if candidates else len(normalized)
@@ -1,18 +1,97 @@
 """Document processing module for extracting text from various file formats."""
 from __future__ import annotations
 
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List
 
 import docx
 import pdfplumber
 from openpyxl import load_workbook
 from pptx import Presentation
 
+try:  # pragma: no cover - optional dependency
+    import fitz  # type: ignore  # PyMuPDF
+except Exception:  # pragma: no cover - fallback to pdfplumber
+    fitz = None
+
+try:  # pragma: no cover - optional dependency
+    from lxml import etree  # type: ignore
+except Exception:  # pragma: no cover - fallback to the object-model parsers
+    etree = None
+
+try:  # pragma: no cover - optional dependency
+    from python_calamine import CalamineWorkbook  # type: ignore
+except Exception:  # pragma: no cover - fallback to openpyxl
+    CalamineWorkbook = None
+
+# OOXML namespaces for the raw-XML fast paths
+_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+_SLIDE_NAME_RE = re.compile(r"^ppt/slides/slide(\d+)\.xml$")
+
+DEFAULT_EXTS = frozenset({".pptx", ".docx", ".pdf", ".xlsx", ".xls"})
+
+
+def _process_one(path: str, **options: Any) -> Dict[str, str | List[str]]:
+    """Process a single file in a worker process.
+
+    Module-level so it pickles cleanly; each worker builds its own
+    processor because the underlying parser objects are not picklable.
+    ``options`` are DocumentProcessor constructor arguments so workers
+    mirror the submitting processor's configuration.
+    """
+
+    return DocumentProcessor(**options).process_file(path)
+
 
 class DocumentProcessor:
     """Extract text content from various document formats."""
 
+    def __init__(
+        self,
+        *,
+        extract_pdf_tables: bool = False,
+        fast_pptx: bool = True,
+        fast_docx: bool = True,
+        pdf_page_workers: int = 1,
+    ) -> None:
+        """
+        Initialize the processor.
+
+        Args:
+            extract_pdf_tables: Extract PDF tables via pdfplumber. Off by
+                default so text-only PDFs take the much faster PyMuPDF path
+                when it is installed.
+            fast_pptx: Read slide XML directly with lxml instead of
+                building the python-pptx object model, when lxml is
+                installed. Disable to force the object-model parser.
+            fast_docx: Same for Word documents: stream word/document.xml
+                with lxml instead of building the python-docx model.
+            pdf_page_workers: Thread count for pdfplumber page parsing.
+                Each worker opens its own handle on the PDF because
+                pdfplumber is not thread-safe; sequential by default
+                since the extra opens only pay off on large documents.
+        """
+        self.extract_pdf_tables = extract_pdf_tables
+        self.fast_pptx = fast_pptx
+        self.fast_docx = fast_docx
+        self.pdf_page_workers = pdf_page_workers
+
+    def _options(self) -> Dict[str, Any]:
+        """Constructor options for rebuilding this processor in a worker."""
+        return {
+            "extract_pdf_tables": self.extract_pdf_tables,
+            "fast_pptx": self.fast_pptx,
+            "fast_docx": self.fast_docx,
+            "pdf_page_workers": self.pdf_page_workers,
+        }
+
     def process_file(self, file_path: str | Path) -> Dict[str, str | List[str]]:
         """
         Process a document file and extract text content.
@@ -43,21 +122,25 @@ class DocumentProcessor:
     
     def _process_pptx(self, file_path: Path) -> Dict[str, str | List[str]]:
         """Extract text from PowerPoint presentations."""
+        if etree is not None and self.fast_pptx:
+            return self._process_pptx_fast(file_path)
+
         prs = Presentation(file_path)
         slides_content = []
         
         for slide_num, slide in enumerate(prs.slides, 1):
             slide_text = []
             
-            # Extract text from shapes
+            # Extract text from shapes; has_text_frame/has_table are cheap
+            # flags, unlike hasattr probes through the shape proxy
             for shape in slide.shapes:
-                if hasattr(shape, "text") and shape.text.strip():
-                    slide_text.append(shape.text.strip())
-                
-                # Extract text from tables
-                if hasattr(shape, "table"):
+                if shape.has_text_frame:
+                    text = shape.text_frame.text.strip()
+                    if text:
+                        slide_text.append(text)
+                elif shape.has_table:
                     for row in shape.table.rows:
-                        row_text = " | ".join(cell.text.strip() for cell in row.cells if cell.text.strip())
+                        row_text = " | ".join(t for t in (c.text.strip() for c in row.cells) if t)
                         if row_text:
                             slide_text.append(row_text)
             
@@ -74,8 +157,85 @@ class DocumentProcessor:
             "full_text": "\n\n".join(slide["content"] for slide in slides_content)
         }
     
+    def _process_pptx_fast(self, file_path: Path) -> Dict[str, str | List[str]]:
+        """Extract PPTX text by streaming slide XML through lxml.
+
+        python-pptx builds the full OOXML object model per slide, but
+        ingestion only needs run text and table cells, so this path walks
+        the raw ``ppt/slides/slide*.xml`` entries with iterparse instead.
+        Output matches ``_process_pptx``.
+        """
+        slides_content = []
+
+        with zipfile.ZipFile(file_path) as zf:
+            slide_names = sorted(
+                (int(m.group(1)), name)
+                for name in zf.namelist()
+                if (m := _SLIDE_NAME_RE.match(name))
+            )
+            for slide_num, name in slide_names:
+                with zf.open(name) as stream:
+                    slide_text = self._extract_slide_xml(stream)
+                if slide_text:
+                    slides_content.append({
+                        "slide": slide_num,
+                        "content": "\n".join(slide_text)
+                    })
+
+        return {
+            "file_name": file_path.name,
+            "file_type": "pptx",
+            "slides": slides_content,
+            "full_text": "\n\n".join(slide["content"] for slide in slides_content)
+        }
+
+    @staticmethod
+    def _extract_slide_xml(stream) -> List[str]:
+        """Pull shape text and table rows out of one slide's XML stream."""
+        slide_text: List[str] = []
+        run_parts: List[str] = []
+        shape_paras: List[str] = []
+        cell_paras: List[str] = []
+        row_cells: List[str] = []
+        in_table = 0
+
+        tags = (_A + "t", _A + "p", _A + "tbl", _A + "tc", _A + "tr", _P + "sp")
+        for event, elem in etree.iterparse(stream, events=("start", "end"), tag=tags):
+            if event == "start":
+                if elem.tag == _A + "tbl":
+                    in_table += 1
+                continue
+            if elem.tag == _A + "t":
+                if elem.text:
+                    run_parts.append(elem.text)
+            elif elem.tag == _A + "p":
+                para = "".join(run_parts).strip()
+                run_parts.clear()
+                if para:
+                    (cell_paras if in_table else shape_paras).append(para)
+            elif elem.tag == _A + "tc":
+                row_cells.append("\n".join(cell_paras))
+                cell_paras.clear()
+            elif elem.tag == _A + "tr":
+                row_text = " | ".join(cell for cell in row_cells if cell)
+                row_cells.clear()
+                if row_text:
+                    slide_text.append(row_text)
+            elif elem.tag == _A + "tbl":
+                in_table -= 1
+            elif elem.tag == _P + "sp":
+                if shape_paras:
+                    slide_text.append("\n".join(shape_paras))
+                    shape_paras.clear()
+            elem.clear()
+
+        return slide_text
+
     def _process_docx(self, file_path: Path) -> Dict[str, str | List[str]]:
         """Extract text from Word documents."""
+        if etree is not None and self.fast_docx:
+            return self._process_docx_fast(file_path)
+
         doc = docx.Document(file_path)
         paragraphs = []
         tables_content = []
@@ -89,7 +249,7 @@ class DocumentProcessor:
         for table in doc.tables:
             table_text = []
             for row in table.rows:
-                row_text = " | ".join(cell.text.strip() for cell in row.cells if cell.text.strip())
+                row_text = " | ".join(t for t in (c.text.strip() for c in row.cells) if t)
                 if row_text:
                     table_text.append(row_text)
             if table_text:
@@ -107,42 +267,172 @@ class DocumentProcessor:
             "full_text": full_text
         }
     
+    def _process_docx_fast(self, file_path: Path) -> Dict[str, str | List[str]]:
+        """Extract DOCX text by streaming word/document.xml through lxml.
+
+        Only ``w:t`` content is needed for ingestion, so this path skips
+        the python-docx paragraph/run/cell object model entirely. Output
+        matches ``_process_docx``.
+        """
+        paragraphs: List[str] = []
+        tables_content: List[str] = []
+        run_parts: List[str] = []
+        cell_paras: List[str] = []
+        row_cells: List[str] = []
+        table_rows: List[str] = []
+        in_table = 0
+
+        tags = (_W + "t", _W + "p", _W + "tbl", _W + "tc", _W + "tr")
+        with zipfile.ZipFile(file_path) as zf, zf.open("word/document.xml") as stream:
+            for event, elem in etree.iterparse(stream, events=("start", "end"), tag=tags):
+                if event == "start":
+                    if elem.tag == _W + "tbl":
+                        in_table += 1
+                    continue
+                if elem.tag == _W + "t":
+                    if elem.text:
+                        run_parts.append(elem.text)
+                elif elem.tag == _W + "p":
+                    para = "".join(run_parts).strip()
+                    run_parts.clear()
+                    if para:
+                        (cell_paras if in_table else paragraphs).append(para)
+                elif elem.tag == _W + "tc":
+                    row_cells.append("\n".join(cell_paras))
+                    cell_paras.clear()
+                elif elem.tag == _W + "tr":
+                    row_text = " | ".join(cell for cell in row_cells if cell)
+                    row_cells.clear()
+                    if row_text:
+                        table_rows.append(row_text)
+                elif elem.tag == _W + "tbl":
+                    in_table -= 1
+                    if table_rows:
+                        tables_content.append("\n".join(table_rows))
+                        table_rows.clear()
+                elem.clear()
+
+        full_text = "\n".join(paragraphs)
+        if tables_content:
+            full_text += "\n\nTables:\n" + "\n\n".join(tables_content)
+
+        return {
+            "file_name": file_path.name,
+            "file_type": "docx",
+            "paragraphs": paragraphs,
+            "tables": tables_content,
+            "full_text": full_text
+        }
+
     def _process_pdf(self, file_path: Path) -> Dict[str, str | List[str]]:
         """Extract text from PDF files."""
-        pages_content = []
-        
+        if fitz is not None and not self.extract_pdf_tables:
+            return self._process_pdf_fast(file_path)
+
+        # pdfplumber/pdfminer lazily seek on the underlying stream with no
+        # locking, so pages of one PDF object must never be read from two
+        # threads. Parallelism instead gives each worker a strided slice
+        # of page numbers and its own handle on the file; map() keeps the
+        # slices in submission order for reassembly.
+        with pdfplumber.open(file_path) as pdf:
+            page_count = len(pdf.pages)
+            workers = min(self.pdf_page_workers, page_count)
+            if workers <= 1:
+                extracted = [self._extract_pdf_page(page) for page in pdf.pages]
+
+        if workers > 1:
+            ranges = [range(start, page_count, workers) for start in range(workers)]
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                slices = list(
+                    executor.map(
+                        lambda indices: self._extract_pdf_pages(file_path, indices),
+                        ranges,
+                    )
+                )
+            # Re-interleave the strided slices back into page order
+            extracted = [None] * page_count  # type: ignore[list-item]
+            for indices, parts in zip(ranges, slices):
+                for index, page_parts in zip(indices, parts):
+                    extracted[index] = page_parts
+
+        pages_content = [
+            {"page": page_num, "content": content}
+            for page_num, parts in enumerate(extracted, 1)
+            for content in parts
+        ]
+
+        return {
+            "file_name": file_path.name,
+            "file_type": "pdf",
+            "pages": pages_content,
+            "full_text": "\n\n".join(page["content"] for page in pages_content)
+        }
+
+    def _extract_pdf_pages(self, file_path: Path, indices) -> List[List[str]]:
+        """Extract several pages through a worker-private PDF handle."""
         with pdfplumber.open(file_path) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                text = page.extract_text()
+            return [self._extract_pdf_page(pdf.pages[i]) for i in indices]
+
+    @staticmethod
+    def _extract_pdf_page(page) -> List[str]:
+        """Extract text and table blocks from one page, then drop its cache.
+
+        pdfplumber retains layout objects per page for the lifetime of the
+        PDF; flushing after each page keeps resident memory O(1) in page
+        count instead of O(pages) on large documents.
+        """
+        parts: List[str] = []
+
+        text = page.extract_text()
+        if text and text.strip():
+            parts.append(text.strip())
+
+        # Extract tables
+        tables = page.extract_tables()
+        if tables:
+            for table in tables:
+                table_text = "\n".join(
+                    " | ".join(s for c in row if c and (s := str(c)))
+                    for row in table if row
+                )
+                if table_text:
+                    parts.append(f"[TABLE]\n{table_text}")
+
+        page.flush_cache()
+        return parts
+
+    def _process_pdf_fast(self, file_path: Path) -> Dict[str, str | List[str]]:
+        """Extract PDF text via the MuPDF C engine (no table extraction)."""
+        pages_content = []
+
+        doc = fitz.open(file_path)
+        try:
+            for page_num, page in enumerate(doc, 1):
+                text = page.get_text("text")
                 if text and text.strip():
                     pages_content.append({
                         "page": page_num,
                         "content": text.strip()
                     })
-                
-                # Extract tables
-                tables = page.extract_tables()
-                if tables:
-                    for table in tables:
-                        table_text = "\n".join(
-                            " | ".join(str(cell) for cell in row if cell)
-                            for row in table if row
-                        )
-                        if table_text:
-                            pages_content.append({
-                                "page": page_num,
-                                "content": f"[TABLE]\n{table_text}"
-                            })
-        
+        finally:
+            doc.close()
+
         return {
             "file_name": file_path.name,
             "file_type": "pdf",
             "pages": pages_content,
             "full_text": "\n\n".join(page["content"] for page in pages_content)
         }
-    
+
     def _process_excel(self, file_path: Path) -> Dict[str, str | List[str]]:
         """Extract text from Excel files."""
+        if CalamineWorkbook is not None:
+            try:
+                return self._process_excel_calamine(file_path)
+            except Exception:
+                # Some legacy .xls variants trip calamine; openpyxl below
+                pass
+
         wb = load_workbook(file_path, read_only=True, data_only=True)
         sheets_content = []
         
@@ -151,10 +441,13 @@ class DocumentProcessor:
             rows_text = []
             
             for row in sheet.iter_rows(values_only=True):
-                # Filter out empty cells and convert to string
-                row_values = [str(cell) for cell in row if cell is not None and str(cell).strip()]
-                if row_values:
-                    rows_text.append(" | ".join(row_values))
+                # Filter out empty cells; stringify and strip each cell once
+                row_text = " | ".join(
+                    value for cell in row
+                    if cell is not None and (value := str(cell).strip())
+                )
+                if row_text:
+                    rows_text.append(row_text)
             
             if rows_text:
                 sheets_content.append({
@@ -171,29 +464,88 @@ class DocumentProcessor:
             "full_text": "\n\n".join(f"[Sheet: {s['sheet']}]\n{s['content']}" for s in sheets_content)
         }
     
-    def process_directory(self, directory_path: str | Path, extensions: List[str] | None = None) -> List[Dict]:
+    def _process_excel_calamine(self, file_path: Path) -> Dict[str, str | List[str]]:
+        """Extract Excel text via the Rust calamine reader.
+
+        Reads workbooks an order of magnitude faster than openpyxl, which
+        parses shared strings and sheet XML in pure Python even in
+        read-only mode. Output matches ``_process_excel``.
         """
-        Process all documents in a directory.
-        
+        wb = CalamineWorkbook.from_path(str(file_path))
+        sheets_content = []
+
+        join = " | ".join
+        for sheet_name in wb.sheet_names:
+            rows = wb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=True)
+            rows_text = []
+            append = rows_text.append
+
+            # Calamine already yields str for text cells, so only numeric
+            # and date cells pay a str() call
+            for row in rows:
+                row_text = join(
+                    value for cell in row
+                    if cell is not None
+                    and (value := (cell if type(cell) is str else str(cell)).strip())
+                )
+                if row_text:
+                    append(row_text)
+
+            if rows_text:
+                sheets_content.append({
+                    "sheet": sheet_name,
+                    "content": "\n".join(rows_text)
+                })
+
+        return {
+            "file_name": file_path.name,
+            "file_type": "xlsx",
+            "sheets": sheets_content,
+            "full_text": "\n\n".join(f"[Sheet: {s['sheet']}]\n{s['content']}" for s in sheets_content)
+        }
+
+    def process_directory(
+        self,
+        directory_path: str | Path,
+        extensions: List[str] | None = None,
+        max_workers: int | None = None,
+    ) -> List[Dict]:
+        """
+        Process all documents in a directory, recursing into subfolders.
+
         Args:
             directory_path: Path to the directory
-            extensions: List of file extensions to process (default: all supported)
-            
+            extensions: File extensions to process (default: all supported)
+            max_workers: Worker process count (default: CPU count)
+
         Returns:
             List of extracted document contents
         """
         directory_path = Path(directory_path)
-        
-        if extensions is None:
-            extensions = [".pptx", ".docx", ".pdf", ".xlsx", ".xls"]
-        
+
+        wanted = frozenset(e.lower() for e in (extensions or DEFAULT_EXTS))
+
+        file_paths = [
+            file_path for file_path in directory_path.rglob("*")
+            if file_path.is_file() and file_path.suffix.lower() in wanted
+        ]
+
         results = []
-        for file_path in directory_path.iterdir():
-            if file_path.is_file() and file_path.suffix.lower() in extensions:
+        if not file_paths:
+            return results
+
+        # Each file is independent and parsing is CPU-bound pure Python,
+        # so fan the batch out across worker processes.
+        options = self._options()
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {
+                executor.submit(_process_one, str(p), **options): p for p in file_paths
+            }
+            for future in as_completed(futures):
+                file_path = futures[future]
                 try:
-                    content = self.process_file(file_path)
-                    results.append(content)
+                    results.append(future.result())
                 except Exception as e:
                     print(f"Error processing {file_path.name}: {e}")
-        
+
         return results
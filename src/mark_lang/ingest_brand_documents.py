@@ -16,24 +16,78 @@ Or with specific files:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List
+from typing import List, Optional
+
+try:  # pragma: no cover - optional dependency
+    import orjson
+except Exception:  # pragma: no cover - fallback to stdlib json
+    orjson = None
 
 from .brand_guidelines_extractor import BrandGuidelinesExtractor
-from .document_processor import DocumentProcessor
+from .document_processor import DocumentProcessor, _process_one
 from .translator import TextTranslator
 
 
 class BrandDocumentIngestionWorkflow:
     """Orchestrate the document ingestion and guidelines extraction process."""
 
-    def __init__(self):
-        """Initialize the workflow with necessary components."""
+    def __init__(self, cache_dir: str | Path | None = ".mark_lang_cache"):
+        """
+        Initialize the workflow with necessary components.
+
+        Args:
+            cache_dir: Directory for the extraction cache keyed by file
+                path and stamped with (mtime, size); pass None to disable
+        """
         self.doc_processor = DocumentProcessor()
         self.translator = TextTranslator(source_lang="no", target_lang="en")
         self.guidelines_extractor = BrandGuidelinesExtractor()
-    
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    def _cache_path(self, file_path: Path) -> Path:
+        key = hashlib.sha1(str(file_path.resolve()).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.pkl"
+
+    def _cached_extraction(self, file_path: Path, stamp: tuple) -> Optional[dict]:
+        """Return the cached extraction for a file, or None on miss."""
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._cache_path(file_path), "rb") as f:
+                cached_stamp, document = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+        return document if cached_stamp == stamp else None
+
+    def _store_extraction(self, file_path: Path, stamp: tuple, document: dict) -> None:
+        if self.cache_dir is None:
+            return
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(self._cache_path(file_path), "wb") as f:
+                pickle.dump((stamp, document), f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"  ! Extraction cache write error: {e}")
+
+    @staticmethod
+    def _stamp(file_path: Path) -> tuple:
+        stat = file_path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _translate_document_safe(self, document: dict) -> dict:
+        """Translate one document, falling back to the original on errors."""
+        try:
+            return self.translator.translate_document(document)
+        except Exception as e:
+            print(f"  ! Translation error for {document['file_name']}: {e}")
+            return document
+
+
     def process_files(self, file_paths: List[str | Path]) -> dict:
         """
         Process specific files.
@@ -46,36 +100,65 @@ class BrandDocumentIngestionWorkflow:
         """
         print(f"Processing {len(file_paths)} files...")
         
-        # Step 1: Extract text from documents
+        # Steps 1+2 are pipelined: each document is handed to the
+        # translator pool as soon as its extraction finishes, so the
+        # translation network latency hides behind PDF/PPTX parsing CPU
+        # work instead of adding to it.
         print("\n[1/4] Extracting text from documents...")
         documents = []
-        for file_path in file_paths:
-            try:
-                print(f"  - Processing: {Path(file_path).name}")
-                doc = self.doc_processor.process_file(file_path)
-                documents.append(doc)
-            except Exception as e:
-                print(f"  ! Error processing {Path(file_path).name}: {e}")
-        
-        if not documents:
-            print("No documents were successfully processed.")
-            return {"error": "No documents processed"}
-        
-        print(f"  ✓ Successfully processed {len(documents)} documents")
-        
-        # Step 2: Translate documents
-        print("\n[2/4] Translating Norwegian content to English...")
-        translated_docs = []
-        for i, doc in enumerate(documents, 1):
-            print(f"  - Translating document {i}/{len(documents)}: {doc['file_name']}")
+        to_extract = []
+        for file_path in map(Path, file_paths):
             try:
-                translated = self.translator.translate_document(doc)
-                translated_docs.append(translated)
-            except Exception as e:
-                print(f"  ! Translation error for {doc['file_name']}: {e}")
-                # Include untranslated document as fallback
-                translated_docs.append(doc)
-        
+                stamp = self._stamp(file_path)
+            except OSError as e:
+                print(f"  ! Error processing {file_path.name}: {e}")
+                continue
+            cached = self._cached_extraction(file_path, stamp)
+            if cached is not None:
+                documents.append(cached)
+                print(f"  - Cached: {file_path.name}")
+            else:
+                to_extract.append((file_path, stamp))
+
+        with ThreadPoolExecutor(max_workers=4) as translate_pool:
+            translate_futures = [
+                translate_pool.submit(self._translate_document_safe, doc)
+                for doc in documents
+            ]
+
+            if to_extract:
+                options = self.doc_processor._options()
+                with ProcessPoolExecutor() as executor:
+                    futures = {
+                        executor.submit(
+                            _process_one, str(file_path), **options
+                        ): (file_path, stamp)
+                        for file_path, stamp in to_extract
+                    }
+                    for future in as_completed(futures):
+                        file_path, stamp = futures[future]
+                        try:
+                            document = future.result()
+                        except Exception as e:
+                            print(f"  ! Error processing {file_path.name}: {e}")
+                            continue
+                        documents.append(document)
+                        self._store_extraction(file_path, stamp, document)
+                        print(f"  - Processed: {file_path.name}")
+                        translate_futures.append(
+                            translate_pool.submit(self._translate_document_safe, document)
+                        )
+
+            if not documents:
+                print("No documents were successfully processed.")
+                return {"error": "No documents processed"}
+
+            print(f"  ✓ Successfully processed {len(documents)} documents")
+
+            # Step 2: Gather translations, most of which are already in flight
+            print("\n[2/4] Translating Norwegian content to English...")
+            translated_docs = [future.result() for future in translate_futures]
+
         print(f"  ✓ Translation completed")
         
         # Step 3: Extract brand guidelines
@@ -153,9 +236,15 @@ class BrandDocumentIngestionWorkflow:
         for doc in documents:
             file_name = Path(doc["file_name"]).stem + "_translated.json"
             output_path = output_dir / file_name
-            
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(doc, f, indent=2, ensure_ascii=False)
+
+            if orjson is not None:
+                # Serialization is CPU-bound on large corpora; orjson emits
+                # UTF-8 bytes directly, so write in binary mode
+                with open(output_path, "wb") as f:
+                    f.write(orjson.dumps(doc, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    json.dump(doc, f, indent=2, ensure_ascii=False)
         
         print(f"✓ Translated documents saved to: {output_dir}")
 
@@ -190,7 +279,12 @@ def main():
         default="examples/translated",
         help="Directory to save translated documents (default: examples/translated)"
     )
-    
+    parser.add_argument(
+        "--cache-dir",
+        default=".mark_lang_cache",
+        help="Directory for the extraction cache; pass '' to disable (default: .mark_lang_cache)"
+    )
+
     args = parser.parse_args()
     
     # Validate input
@@ -198,7 +292,7 @@ def main():
         parser.error("Either provide a path or use --files to specify documents")
     
     # Initialize workflow
-    workflow = BrandDocumentIngestionWorkflow()
+    workflow = BrandDocumentIngestionWorkflow(cache_dir=args.cache_dir or None)
     
     # Process documents
     if args.files:
@@ -1,196 +1,365 @@
 """Translation module for converting Norwegian content to English."""
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import Dict, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from deep_translator import GoogleTranslator
 
+_MEMORY_CACHE_SIZE = 4096
+
+# Compiled once so chunking skips the re cache lookup per paragraph
+_SENT_RE = re.compile(r'([.!?]+\s+)')
+_PARA_RE = re.compile(r'\n\n+')
+
+# Norwegian-specific letters used as a cheap already-English detector
+_NORWEGIAN_CHARS = "æøåÆØÅ"
+_NORWEGIAN_RATIO_THRESHOLD = 0.001
+_ENGLISH_SKIP_MIN_LEN = 2048
+
+
+def _looks_english(text: str) -> bool:
+    """Heuristically detect text with no Norwegian-specific letters.
+
+    Mixed corpora routinely contain documents already written in English;
+    counting æ/ø/å against total length avoids a network round-trip for
+    them without any extra dependency. Short strings never skip: plenty
+    of genuine Norwegian sentences contain no æ/ø/å at all, so the ratio
+    only means anything on document-sized text.
+    """
+
+    if len(text) < _ENGLISH_SKIP_MIN_LEN:
+        return False
+    norwegian = sum(text.count(char) for char in _NORWEGIAN_CHARS)
+    return norwegian / len(text) < _NORWEGIAN_RATIO_THRESHOLD
+
 
 class TextTranslator:
     """Translate Norwegian text to English with chunking support."""
 
-    def __init__(self, source_lang: str = "no", target_lang: str = "en"):
+    def __init__(
+        self,
+        source_lang: str = "no",
+        target_lang: str = "en",
+        cache_dir: str | Path | None = ".mark_lang_translate_cache",
+    ):
         """
         Initialize the translator.
-        
+
         Args:
             source_lang: Source language code (default: 'no' for Norwegian)
             target_lang: Target language code (default: 'en' for English)
+            cache_dir: Directory for the on-disk translation cache keyed by
+                content hash; pass None to disable caching
         """
         self.source_lang = source_lang
         self.target_lang = target_lang
         self.translator = GoogleTranslator(source=source_lang, target=target_lang)
         self.max_chunk_size = 4500  # Google Translate API limit
-    
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        self._memory_cache: Dict[str, str] = {}
+        self._local = threading.local()
+
+    def _cache_key(self, text: str) -> str:
+        payload = f"{self.source_lang}|{self.target_lang}|{text}".encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        cached = self._memory_cache.get(key)
+        if cached is not None:
+            return cached
+        if self._cache_dir is not None:
+            cache_path = self._cache_dir / key
+            try:
+                cached = cache_path.read_text(encoding="utf-8")
+            except OSError:
+                return None
+            self._memory_cache[key] = cached
+            return cached
+        return None
+
+    def _cache_put(self, key: str, translated: str) -> None:
+        if len(self._memory_cache) >= _MEMORY_CACHE_SIZE:
+            # Concurrent evictions may race for the same oldest key;
+            # losing that race is fine, so tolerate it
+            try:
+                self._memory_cache.pop(next(iter(self._memory_cache)), None)
+            except (StopIteration, RuntimeError):
+                pass
+        self._memory_cache[key] = translated
+        if self._cache_dir is not None:
+            try:
+                self._cache_dir.mkdir(parents=True, exist_ok=True)
+                (self._cache_dir / key).write_text(translated, encoding="utf-8")
+            except OSError as e:
+                print(f"Translation cache write error: {e}")
+
     def translate(self, text: str) -> str:
         """
         Translate text from source to target language.
-        
+
+        Results are memoized in process and on disk keyed by a hash of
+        (source_lang, target_lang, text), so repeated boilerplate never
+        hits the API twice.
+
         Args:
             text: Text to translate
-            
+
         Returns:
             Translated text
         """
         if not text or not text.strip():
             return text
-        
+
+        # Norwegian sources that look English already need no API call
+        if self.source_lang == "no" and _looks_english(text):
+            return text
+
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
         # If text is short enough, translate directly
         if len(text) <= self.max_chunk_size:
             try:
-                return self.translator.translate(text)
+                translated = self.translator.translate(text)
             except Exception as e:
                 print(f"Translation error: {e}")
+                # Failures are returned untranslated and never cached
                 return text
-        
-        # For longer text, split into chunks
-        return self._translate_chunks(text)
+        else:
+            # For longer text, split into chunks; a partial failure is
+            # returned as-is but must never poison the cache
+            translated, ok = self._translate_chunks(text)
+            if not ok:
+                return translated
+
+        self._cache_put(key, translated)
+        return translated
     
-    def _translate_chunks(self, text: str) -> str:
+    def _thread_translator(self) -> GoogleTranslator:
+        """Per-thread translator; GoogleTranslator is not threadsafe."""
+        translator = getattr(self._local, "translator", None)
+        if translator is None:
+            translator = GoogleTranslator(source=self.source_lang, target=self.target_lang)
+            self._local.translator = translator
+        return translator
+
+    def _safe_translate(self, chunk: str) -> tuple[str, bool]:
+        """Translate one chunk, returning (text, succeeded).
+
+        On API errors the original chunk comes back with a False flag so
+        callers can avoid caching partially untranslated output.
         """
-        Split long text into chunks and translate each chunk.
-        
+        try:
+            return self._thread_translator().translate(chunk), True
+        except Exception as e:
+            print(f"Translation error: {e}")
+            return chunk, False
+
+    def _translate_chunks(self, text: str) -> tuple[str, bool]:
+        """
+        Split long text into chunks and translate the chunks concurrently.
+
+        Each chunk is an independent network round-trip, so they are
+        fanned out over a thread pool and reassembled in input order.
+
         Args:
             text: Long text to translate
-            
+
         Returns:
-            Translated text
+            (translated text, True if every chunk translated cleanly)
         """
-        # Split by paragraphs first to maintain structure
-        paragraphs = text.split("\n\n")
-        translated_paragraphs = []
-        
-        current_chunk = ""
+        # Split by paragraphs first to maintain structure; consecutive
+        # blank lines collapse into one boundary. Units group the chunks
+        # that belong to one output paragraph.
+        paragraphs = _PARA_RE.split(text)
+        units: List[List[str]] = []
+
+        current_parts: List[str] = []
+        current_len = 0
         for para in paragraphs:
-            # If adding this paragraph exceeds limit, translate current chunk
-            if len(current_chunk) + len(para) + 2 > self.max_chunk_size:
-                if current_chunk:
-                    try:
-                        translated = self.translator.translate(current_chunk)
-                        translated_paragraphs.append(translated)
-                    except Exception as e:
-                        print(f"Translation error: {e}")
-                        translated_paragraphs.append(current_chunk)
-                    current_chunk = para
+            # If adding this paragraph exceeds limit, close the current chunk
+            if current_len + len(para) + 2 > self.max_chunk_size:
+                if current_parts:
+                    units.append(["\n\n".join(current_parts)])
+                    current_parts = [para]
+                    current_len = len(para)
                 else:
                     # Single paragraph is too long, split by sentences
-                    translated_paragraphs.append(self._translate_long_paragraph(para))
+                    units.append(self._split_long_paragraph(para))
             else:
-                current_chunk += "\n\n" + para if current_chunk else para
-        
-        # Translate remaining chunk
-        if current_chunk:
-            try:
-                translated = self.translator.translate(current_chunk)
-                translated_paragraphs.append(translated)
-            except Exception as e:
-                print(f"Translation error: {e}")
-                translated_paragraphs.append(current_chunk)
-        
-        return "\n\n".join(translated_paragraphs)
-    
+                if current_parts:
+                    current_len += 2
+                current_parts.append(para)
+                current_len += len(para)
+        if current_parts:
+            units.append(["\n\n".join(current_parts)])
+
+        chunks = [chunk for unit in units for chunk in unit]
+        if len(chunks) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+                outcomes = list(executor.map(self._safe_translate, chunks))
+        else:
+            outcomes = [self._safe_translate(chunk) for chunk in chunks]
+        translated = [text for text, _ in outcomes]
+        ok = all(succeeded for _, succeeded in outcomes)
+
+        # Sentence chunks split from one long paragraph rejoin with spaces,
+        # whole-paragraph chunks with blank lines
+        pieces = []
+        position = 0
+        for unit in units:
+            pieces.append(" ".join(translated[position:position + len(unit)]))
+            position += len(unit)
+        return "\n\n".join(pieces), ok
+
+    def _split_long_paragraph(self, paragraph: str) -> List[str]:
+        """Split an oversized paragraph into sentence chunks under the limit."""
+        sentences = _SENT_RE.split(paragraph)
+        chunks: List[str] = []
+        current_parts: List[str] = []
+        current_len = 0
+
+        for i in range(0, len(sentences), 2):
+            sentence = sentences[i]
+            delimiter = sentences[i + 1] if i + 1 < len(sentences) else ""
+
+            if current_len + len(sentence) + len(delimiter) > self.max_chunk_size:
+                if current_parts:
+                    chunks.append("".join(current_parts))
+                    current_parts = [sentence + delimiter]
+                    current_len = len(sentence) + len(delimiter)
+                else:
+                    # Even a single sentence is too long; truncate it
+                    chunks.append(sentence[:self.max_chunk_size])
+            else:
+                current_parts.append(sentence + delimiter)
+                current_len += len(sentence) + len(delimiter)
+
+        if current_parts:
+            chunks.append("".join(current_parts))
+        return chunks
+
     def _translate_long_paragraph(self, paragraph: str) -> str:
         """
         Translate a very long paragraph by splitting into sentences.
-        
+
         Args:
             paragraph: Long paragraph to translate
-            
+
         Returns:
             Translated paragraph
         """
-        # Simple sentence splitter
-        sentences = re.split(r'([.!?]+\s+)', paragraph)
-        translated_sentences = []
-        current_chunk = ""
-        
-        for i in range(0, len(sentences), 2):
-            sentence = sentences[i]
-            delimiter = sentences[i + 1] if i + 1 < len(sentences) else ""
-            
-            if len(current_chunk) + len(sentence) + len(delimiter) > self.max_chunk_size:
-                if current_chunk:
-                    try:
-                        translated = self.translator.translate(current_chunk)
-                        translated_sentences.append(translated)
-                    except Exception as e:
-                        print(f"Translation error: {e}")
-                        translated_sentences.append(current_chunk)
-                    current_chunk = sentence + delimiter
-                else:
-                    # Even single sentence is too long, truncate or handle
-                    try:
-                        translated = self.translator.translate(sentence[:self.max_chunk_size])
-                        translated_sentences.append(translated)
-                    except Exception as e:
-                        print(f"Translation error: {e}")
-                        translated_sentences.append(sentence)
+        return " ".join(
+            self._safe_translate(chunk)[0]
+            for chunk in self._split_long_paragraph(paragraph)
+        )
+    
+    def translate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Translate several strings, batching the API round-trips.
+
+        Each string first goes through the already-English skip and the
+        content-hash cache; only the remaining misses short enough for
+        the API limit go out in one translate_batch request, and
+        oversized misses fall back to the chunked path individually.
+        Order is preserved.
+
+        Args:
+            texts: Strings to translate
+
+        Returns:
+            Translated strings in input order
+        """
+        results = list(texts)
+        batch_indices: List[int] = []
+        batch_keys: List[str] = []
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            if self.source_lang == "no" and _looks_english(text):
+                continue
+            key = self._cache_key(text)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+            elif len(text) <= self.max_chunk_size:
+                batch_indices.append(i)
+                batch_keys.append(key)
             else:
-                current_chunk += sentence + delimiter
-        
-        if current_chunk:
+                translated, ok = self._translate_chunks(text)
+                results[i] = translated
+                if ok:
+                    self._cache_put(key, translated)
+
+        if batch_indices:
             try:
-                translated = self.translator.translate(current_chunk)
-                translated_sentences.append(translated)
+                translated_batch = self.translator.translate_batch(
+                    [texts[i] for i in batch_indices]
+                )
             except Exception as e:
                 print(f"Translation error: {e}")
-                translated_sentences.append(current_chunk)
-        
-        return " ".join(translated_sentences)
-    
+                for i in batch_indices:
+                    results[i] = self.translate(texts[i])
+            else:
+                for i, key, translated in zip(batch_indices, batch_keys, translated_batch):
+                    results[i] = translated
+                    self._cache_put(key, translated)
+        return results
+
     def translate_document(self, document: Dict) -> Dict:
         """
         Translate a document dictionary extracted by DocumentProcessor.
-        
+
+        All translatable strings are gathered first and sent through one
+        batched request instead of one API round-trip per field.
+
         Args:
             document: Document dictionary with extracted content
-            
+
         Returns:
             Document dictionary with translated content
         """
-        translated_doc = document.copy()
-        
-        # Translate the full text
-        if "full_text" in document:
-            translated_doc["full_text"] = self.translate(document["full_text"])
-        
-        # Translate slides for PPTX
-        if "slides" in document and isinstance(document["slides"], list):
-            translated_slides = []
-            for slide in document["slides"]:
-                translated_slide = slide.copy()
-                if "content" in slide:
-                    translated_slide["content"] = self.translate(slide["content"])
-                translated_slides.append(translated_slide)
-            translated_doc["slides"] = translated_slides
-        
-        # Translate pages for PDF
-        if "pages" in document and isinstance(document["pages"], list):
-            translated_pages = []
-            for page in document["pages"]:
-                translated_page = page.copy()
-                if "content" in page:
-                    translated_page["content"] = self.translate(page["content"])
-                translated_pages.append(translated_page)
-            translated_doc["pages"] = translated_pages
-        
-        # Translate paragraphs for DOCX
-        if "paragraphs" in document and isinstance(document["paragraphs"], list):
-            translated_doc["paragraphs"] = [
-                self.translate(para) for para in document["paragraphs"]
-            ]
-        
-        # Translate sheets for Excel
-        if "sheets" in document and isinstance(document["sheets"], list):
-            translated_sheets = []
-            for sheet in document["sheets"]:
-                translated_sheet = sheet.copy()
-                if "content" in sheet:
-                    translated_sheet["content"] = self.translate(sheet["content"])
-                translated_sheets.append(translated_sheet)
-            translated_doc["sheets"] = translated_sheets
-        
+        # Gather every translatable string in a fixed order, batch once,
+        # then build each output dict in a single pass over the results
+        texts: List[str] = []
+
+        has_full_text = isinstance(document.get("full_text"), str)
+        if has_full_text:
+            texts.append(document["full_text"])
+
+        # Slides (PPTX), pages (PDF), and sheets (Excel) share one shape
+        for list_key in ("slides", "pages", "sheets"):
+            items = document.get(list_key)
+            if isinstance(items, list):
+                texts.extend(item["content"] for item in items if "content" in item)
+
+        # Paragraphs (DOCX) are a flat list of strings
+        paragraphs = document.get("paragraphs")
+        if isinstance(paragraphs, list):
+            texts.extend(paragraphs)
+
+        results = iter(self.translate_batch(texts))
+
+        translated_doc = {**document}
+        if has_full_text:
+            translated_doc["full_text"] = next(results)
+        for list_key in ("slides", "pages", "sheets"):
+            items = document.get(list_key)
+            if isinstance(items, list):
+                translated_doc[list_key] = [
+                    {**item, "content": next(results)} if "content" in item else {**item}
+                    for item in items
+                ]
+        if isinstance(paragraphs, list):
+            translated_doc["paragraphs"] = [next(results) for _ in paragraphs]
+
         return translated_doc
     
     def translate_documents(self, documents: List[Dict]) -> List[Dict]:
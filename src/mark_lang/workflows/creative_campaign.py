@@ -1,43 +1,126 @@
 """LangGraph-based workflow for end-to-end campaign planning."""
 from __future__ import annotations
 
+import asyncio
+import atexit
+import inspect
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Annotated, Any, ClassVar, Dict, List
 
-try:  # pragma: no cover - handled in tests via fallback
-    from langgraph.graph import END, StateGraph
-except Exception:  # pragma: no cover - optional dependency path
-    END = "__end__"
+_START = "__start__"
+_END = "__end__"
 
-    class StateGraph:  # type: ignore[override]
-        """Minimal stand-in for :class:`langgraph.graph.StateGraph`."""
+# One pool for every workflow instance; per-instance executors would
+# multiply idle threads in per-tenant deployments
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) * 4),
+    thread_name_prefix="mark_lang",
+)
+atexit.register(_EXECUTOR.shutdown, wait=False)
 
-        def __init__(self, state_schema: type) -> None:
-            self.state_schema = state_schema
-            self.nodes: Dict[str, Any] = {}
-            self.entry: str | None = None
 
-        def add_node(self, name: str, func: Any) -> None:
-            self.nodes[name] = {"func": func, "edges": []}
+class _SimpleStateGraph:
+    """Minimal stand-in for :class:`langgraph.graph.StateGraph`."""
 
-        def add_edge(self, src: str, dest: str) -> None:
-            self.nodes[src]["edges"].append(dest)
+    def __init__(self, state_schema: type) -> None:
+        self.state_schema = state_schema
+        self.nodes: Dict[str, Any] = {}
+        self.entries: list[str] = []
 
-        def set_entry_point(self, name: str) -> None:
-            self.entry = name
+    def add_node(self, name: str, func: Any) -> None:
+        self.nodes[name] = {"func": func, "edges": []}
 
-        def compile(self):
-            graph = self
+    def add_edge(self, src: str | list, dest: str) -> None:
+        # A list source is a join: dest waits for every listed node;
+        # edges from START mark entry nodes
+        for src_name in [src] if isinstance(src, str) else src:
+            if src_name == _START:
+                self.entries.append(dest)
+            else:
+                self.nodes[src_name]["edges"].append(dest)
 
-            def runner(state: Dict[str, Any]) -> Dict[str, Any]:
-                node_name = graph.entry
-                while node_name and node_name != END:
-                    node = graph.nodes[node_name]
-                    state = node["func"](state)
-                    node_name = node["edges"][0] if node["edges"] else END
+    def set_entry_point(self, name: str) -> None:
+        self.entries = [name]
+
+    def compile(self):
+        # The topology is frozen at compile time, so resolve the
+        # node functions into a tuple of topological layers once;
+        # invoke then iterates the schedule without any per-hop
+        # dict or edge-list lookups
+        indegree = {name: 0 for name in self.nodes}
+        for node in self.nodes.values():
+            for dest in node["edges"]:
+                if dest in indegree:
+                    indegree[dest] += 1
+
+        layers = []
+        ready = list(dict.fromkeys(self.entries))
+        while ready:
+            layers.append(tuple(self.nodes[name]["func"] for name in ready))
+            next_ready = []
+            for name in ready:
+                for dest in self.nodes[name]["edges"]:
+                    if dest not in indegree:
+                        continue
+                    indegree[dest] -= 1
+                    if indegree[dest] == 0:
+                        next_ready.append(dest)
+            ready = next_ready
+        schedule = tuple(layers)
+
+        async def _call(func: Any, state: Dict[str, Any]) -> Any:
+            # Coroutine nodes run on the loop; sync nodes go to the
+            # shared worker pool so parallel frontiers truly overlap
+            if inspect.iscoroutinefunction(func):
+                return await func(state)
+            return await asyncio.get_running_loop().run_in_executor(
+                _EXECUTOR, func, state
+            )
+
+        class _Runner:
+            def invoke(self, state: Dict[str, Any]) -> Dict[str, Any]:
+                return asyncio.run(self.ainvoke(state))
+
+            async def ainvoke(self, state: Dict[str, Any]) -> Dict[str, Any]:
+                for funcs in schedule:
+                    if len(funcs) == 1:
+                        # No sibling branch can race, so mutate the
+                        # shared TypedDict in place instead of copying
+                        results = [await _call(funcs[0], state)]
+                    else:
+                        results = await asyncio.gather(
+                            *(_call(func, dict(state)) for func in funcs)
+                        )
+                    for result in results:
+                        if result:
+                            state.update(result)
                 return state
 
-            return runner
+        return _Runner()
+
+
+_GRAPH_IMPL: tuple | None = None
+
+
+def _load_state_graph() -> tuple:
+    """Resolve (StateGraph, START, END) lazily, caching the result.
+
+    langgraph pulls in pydantic and langchain-core at import time, a
+    noticeable startup cost for callers that only want the state types
+    from this module; the import is deferred until a graph is built.
+    """
+
+    global _GRAPH_IMPL
+    if _GRAPH_IMPL is None:
+        try:
+            from langgraph.graph import END, START, StateGraph
+            _GRAPH_IMPL = (StateGraph, START, END)
+        except Exception:  # pragma: no cover - optional dependency path
+            _GRAPH_IMPL = (_SimpleStateGraph, _START, _END)
+    return _GRAPH_IMPL
 
 
 from typing import TypedDict
@@ -47,16 +130,22 @@ from ..brief_ingest import BriefIngestor, BusinessBrief
 from ..creative_brief import CreativeBrief, CreativeBriefExtractor
 
 
+def _take_latest(_old: Any, new: Any) -> Any:
+    """Reducer for keys written by exactly one branch of a fan-out."""
+    return new
+
+
 class WorkflowState(TypedDict, total=False):
     brief: BusinessBrief
     brand_id: str
-    creative_brief: CreativeBrief
-    guidelines: BrandGuidelines
+    creative_brief: Annotated[CreativeBrief, _take_latest]
+    guidelines: Annotated[BrandGuidelines, _take_latest]
     campaign_plan: Dict[str, Any]
-    gaps: Dict[str, str]
+    gaps: Annotated[Dict[str, str], _take_latest]
+    _guidelines_future: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStateData:
     """Data structure for workflow state results."""
     brief: BusinessBrief
@@ -71,34 +160,130 @@ class WorkflowStateData:
 class CreativeCampaignWorkflow:
     """Coordinate ingestion, extraction, guideline retrieval, and campaign generation."""
 
+    # Static per-channel skeleton: (channel, message template, extra key,
+    # extra value source, extra value attribute)
+    _CHANNEL_SPECS: ClassVar[tuple[tuple[str, str, str, str, str], ...]] = (
+        ("email", "{messaging} | Tone: {tone_of_voice}", "timeline", "brief", "timeframe"),
+        ("social", "Snackable content mirroring '{goals}'", "visual_style", "guidelines", "visual_style"),
+        ("web", "Landing page focused on lead capture", "compliance", "guidelines", "compliance_notes"),
+    )
+
     brand_client: BrandCenterClient
     brief_extractor: CreativeBriefExtractor
     brief_ingestor: BriefIngestor
+    _compiled: Any = field(default=None, init=False, repr=False)
+    _compile_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
 
     def build(self) -> Any:
+        StateGraph, START, END = _load_state_graph()
         graph = StateGraph(WorkflowState)
-        graph.add_node("ingest", self._ingest)
         graph.add_node("extract", self._extract)
         graph.add_node("fetch_guidelines", self._guidelines)
         graph.add_node("campaign", self._campaign)
-        graph.add_node("final", self._finalize)
-        graph.add_edge("ingest", "extract")
-        graph.add_edge("extract", "fetch_guidelines")
-        graph.add_edge("fetch_guidelines", "campaign")
-        graph.add_edge("campaign", "final")
-        graph.add_edge("final", END)
-        graph.set_entry_point("ingest")
+        # Guideline fetching only needs brand_id, so it runs alongside
+        # the CPU-bound extraction; campaign joins the two branches
+        graph.add_edge(START, "extract")
+        graph.add_edge(START, "fetch_guidelines")
+        graph.add_edge(["extract", "fetch_guidelines"], "campaign")
+        graph.add_edge("campaign", END)
         return graph.compile()
 
     def run(self, brief_text: str, *, title: str, brand_id: str) -> WorkflowStateData:
-        runner = self.build()
+        return asyncio.run(self.arun(brief_text, title=title, brand_id=brand_id))
+
+    @staticmethod
+    def resolve_brand_id(brief: BusinessBrief, brand_id: str = "") -> str:
+        """Resolve the effective brand id, falling back to the brief's first tag."""
+        return brand_id or (brief.tags[0] if brief.tags else "default")
+
+    async def _afetch_guidelines(self, brand_id: str) -> BrandGuidelines:
+        """Fetch guidelines without assuming the client is async-aware.
+
+        Duck-typed clients (the CLI's offline connector, test stubs) may
+        only implement fetch_guidelines; those run on a worker thread.
+        """
+        afetch = getattr(self.brand_client, "afetch_guidelines", None)
+        if afetch is not None:
+            return await afetch(brand_id)
+        return await asyncio.to_thread(self.brand_client.fetch_guidelines, brand_id)
+
+    async def run_batch(
+        self,
+        items: List[tuple[str, str, str]],
+        *,
+        concurrency: int = 16,
+    ) -> List[WorkflowStateData]:
+        """Run many briefs concurrently on a shared event loop.
+
+        Guidelines for the unique brand ids are fetched once up front and
+        seeded into every run, so N briefs against one brand cost a single
+        Brand Centre round-trip. The semaphore caps in-flight runs.
+
+        Args:
+            items: (brief_text, title, brand_id) triples
+            concurrency: Maximum number of briefs processed at once
+        """
+        unique_ids = list(dict.fromkeys(brand_id for _, _, brand_id in items if brand_id))
+        prefetched = dict(
+            zip(
+                unique_ids,
+                await asyncio.gather(
+                    *(self._afetch_guidelines(b) for b in unique_ids)
+                ),
+            )
+        )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _one(brief_text: str, title: str, brand_id: str) -> WorkflowStateData:
+            async with semaphore:
+                return await self.arun(
+                    brief_text,
+                    title=title,
+                    brand_id=brand_id,
+                    guidelines=prefetched.get(brand_id),
+                )
+
+        return list(await asyncio.gather(*(_one(*item) for item in items)))
+
+    async def arun(
+        self,
+        brief_text: str,
+        *,
+        title: str,
+        brand_id: str,
+        guidelines: BrandGuidelines | None = None,
+    ) -> WorkflowStateData:
+        # The topology is static, so compile once per instance; the lock
+        # keeps concurrent first runs from double-building
+        runner = self._compiled
+        if runner is None:
+            with self._compile_lock:
+                if self._compiled is None:
+                    self._compiled = self.build()
+                runner = self._compiled
+        # brand_id is known before ingestion starts, so the network fetch
+        # can overlap the CPU-bound brief parsing. run_in_executor hands
+        # the call to a worker thread immediately; a coroutine scheduled
+        # with ensure_future would not start until the loop next yields,
+        # which is only after from_text finishes.
+        prefetch = None
+        if guidelines is None and brand_id:
+            prefetch = asyncio.get_running_loop().run_in_executor(
+                _EXECUTOR, self.brand_client.fetch_guidelines, brand_id
+            )
         initial_brief = self.brief_ingestor.from_text(brief_text, title=title)
         initial_state: WorkflowState = {
             "brief": initial_brief,
-            "brand_id": brand_id,
+            "brand_id": self.resolve_brand_id(initial_brief, brand_id),
             "gaps": {}
         }
-        result = runner.invoke(initial_state)
+        if guidelines is not None:
+            initial_state["guidelines"] = guidelines
+        elif prefetch is not None:
+            initial_state["_guidelines_future"] = prefetch
+        result = await runner.ainvoke(initial_state)
         return WorkflowStateData(
             brief=result["brief"],
             brand_id=result["brand_id"],
@@ -108,50 +293,44 @@ class CreativeCampaignWorkflow:
             gaps=result.get("gaps", {})
         )
 
-    def _ingest(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        return state
-
     def _extract(self, state: Dict[str, Any]) -> Dict[str, Any]:
         brief = state["brief"]
         creative_brief = self.brief_extractor.extract(brief)
         gaps = self.brief_extractor.detect_gaps(creative_brief)
-        state.update({"creative_brief": creative_brief, "gaps": gaps})
-        return state
+        return {"creative_brief": creative_brief, "gaps": gaps}
 
-    def _guidelines(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        brief: BusinessBrief = state["brief"]
-        brand_id = state.get("brand_id") or (brief.tags[0] if brief.tags else "default")
-        guidelines = self.brand_client.fetch_guidelines(brand_id)
-        state["guidelines"] = guidelines
-        return state
+    async def _guidelines(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        if state.get("guidelines") is not None:
+            # Seeded by run_batch prefetching; nothing to fetch
+            return {}
+        future = state.get("_guidelines_future")
+        if future is not None:
+            # Fetch started in arun before ingestion; just collect it
+            return {"guidelines": await future}
+        guidelines = await self._afetch_guidelines(state["brand_id"])
+        return {"guidelines": guidelines}
 
     def _campaign(self, state: Dict[str, Any]) -> Dict[str, Any]:
         creative_brief: CreativeBrief = state["creative_brief"]
         guidelines: BrandGuidelines = state["guidelines"]
-        plan = self._build_plan(creative_brief, guidelines)
-        state["campaign_plan"] = plan
-        return state
-
-    def _finalize(self, state: Dict[str, Any]) -> Dict[str, Any]:
-        return state
+        return {"campaign_plan": self._build_plan(creative_brief, guidelines)}
 
     def _build_plan(self, creative_brief: CreativeBrief, guidelines: BrandGuidelines) -> Dict[str, Any]:
+        values = {
+            "messaging": creative_brief.messaging,
+            "goals": creative_brief.goals,
+            "tone_of_voice": guidelines.tone_of_voice,
+        }
+        sources = {"brief": creative_brief, "guidelines": guidelines}
         multi_channel: List[Dict[str, Any]] = [
             {
-                "channel": "email",
-                "message": f"{creative_brief.messaging} | Tone: {guidelines.tone_of_voice}",
-                "timeline": creative_brief.timeframe,
-            },
-            {
-                "channel": "social",
-                "message": f"Snackable content mirroring '{creative_brief.goals}'",
-                "visual_style": guidelines.visual_style,
-            },
-            {
-                "channel": "web",
-                "message": "Landing page focused on lead capture",
-                "compliance": guidelines.compliance_notes,
-            },
+                # Placeholder-free templates are emitted as-is so every
+                # plan shares the one class-level string object
+                "channel": channel,
+                "message": template.format_map(values) if "{" in template else template,
+                extra_key: getattr(sources[source], attr),
+            }
+            for channel, template, extra_key, source, attr in self._CHANNEL_SPECS
         ]
         return {
             "summary": creative_brief.to_dict(),
@@ -1,26 +1,36 @@
 from types import SimpleNamespace
 
-from mark_lang.brand_center.api_client import BrandCenterClient, BrandGuidelines, BrandCenterError
+from mark_lang.brand_center.api_client import (
+    BrandCenterClient,
+    BrandCenterError,
+    BrandGuidelines,
+    CachedBrandCenterClient,
+)
 
 
 class DummyResponse:
-    def __init__(self, status_code: int, payload: dict | None = None, text: str = "") -> None:
+    def __init__(
+        self, status_code: int, payload: dict | None = None, text: str = "", headers: dict | None = None
+    ) -> None:
         self.status_code = status_code
         self._payload = payload or {}
         self.text = text
+        self.headers = headers or {}
 
     def json(self) -> dict:
         return self._payload
 
 
 class DummySession:
-    def __init__(self, response: DummyResponse):
-        self.response = response
+    def __init__(self, *responses: DummyResponse):
+        self.responses = list(responses)
         self.last_request = None
+        self.calls = 0
 
     def request(self, method, url, headers=None, timeout=None):
+        self.calls += 1
         self.last_request = SimpleNamespace(method=method, url=url, headers=headers, timeout=timeout)
-        return self.response
+        return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
 
 
 def test_fetch_guidelines_success():
@@ -38,6 +48,50 @@ def test_fetch_guidelines_success():
     assert guidelines.visual_style == "Bold"
 
 
+def test_fetch_guidelines_revalidates_with_etag():
+    fresh = DummyResponse(
+        200,
+        {"tone_of_voice": "Friendly", "visual_style": "Bold", "compliance_notes": ""},
+        headers={"ETag": '"v1"'},
+    )
+    not_modified = DummyResponse(304)
+    session = DummySession(fresh, not_modified)
+    client = BrandCenterClient(base_url="https://brand", api_key="token", session=session)
+    first = client.fetch_guidelines("dnb")
+    second = client.fetch_guidelines("dnb")
+    assert session.last_request.headers["If-None-Match"] == '"v1"'
+    assert second is first
+
+
+def test_fetch_guidelines_many_dedupes_ids():
+    response = DummyResponse(
+        200,
+        {"tone_of_voice": "Friendly", "visual_style": "Bold", "compliance_notes": ""},
+    )
+    session = DummySession(response)
+    client = BrandCenterClient(base_url="https://brand", api_key="token", session=session)
+    results = client.fetch_guidelines_many(["dnb", "dnb", "other"])
+    assert session.calls == 2
+    assert set(results) == {"dnb", "other"}
+    assert all(isinstance(guidelines, BrandGuidelines) for guidelines in results.values())
+
+
+def test_cached_client_skips_repeat_requests():
+    response = DummyResponse(
+        200,
+        {"tone_of_voice": "Friendly", "visual_style": "Bold", "compliance_notes": ""},
+    )
+    session = DummySession(response)
+    client = CachedBrandCenterClient(
+        base_url="https://brand", api_key="token", session=session, ttl=60.0
+    )
+    first = client.fetch_guidelines("dnb")
+    session.last_request = None
+    second = client.fetch_guidelines("dnb")
+    assert second is first
+    assert session.last_request is None
+
+
 def test_fetch_guidelines_error_raises():
     response = DummyResponse(403, {"detail": "Forbidden"})
     client = BrandCenterClient(base_url="https://brand", api_key="token", session=DummySession(response))